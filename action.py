@@ -1,11 +1,15 @@
+import sys
 from enum import Enum
+from functools import lru_cache
 from typing import Dict
 from .definition import Definition, Drilling, Manipulation, Path, Probing
 # MODIFGEN from .__init__ import *
 import model
 
 
-ACTION_DEFINITION = {
+# registry keys are interned so the lookups in Action.parse can hit the
+# pointer-identity fast path against the interned incoming type strings
+ACTION_DEFINITION = {sys.intern(k): v for k, v in {
   'MOVE.TCP.WORK': Path,
   'MOVE.TCP.APPROACH': Path,
   'MOVE.TCP.CLEARANCE': Path,
@@ -16,7 +20,26 @@ ACTION_DEFINITION = {
   'WORK.PROBE': Probing,
   'LOAD.EFFECTOR':Manipulation,
   'UNLOAD.EFFECTOR':Manipulation
-}
+}.items()}
+
+# direct type -> parser dispatch, binds the parse function once at import
+# so Action.parse pays a single dict lookup per action
+_ACTION_PARSER = {k: v.parse for k, v in ACTION_DEFINITION.items()}
+
+# static to_dict key tuples: dict(zip(...)) reuses the already-hashed
+# key objects instead of rebuilding a dict literal per call
+_ACTION_KEYS = ('_id', 'type', 'description', 'definition')
+_ACTION_KEYS_NO_ID = _ACTION_KEYS[1:]
+
+
+@lru_cache(maxsize=None)
+def _command_fct(atype: str):
+    """get the command generation function for an action type
+
+    the command register is defined in the register.py file in the mars
+    module; the lookup is memoized per action type
+    """
+    return model.COMMAND_REGISTER[atype]
 
 # action object
 class Action:
@@ -32,13 +55,13 @@ class Action:
     next : List[Action]
         list of next actions
     definition : object
-        definition object. read only
+        definition object
     priority : int
-        action priority. read only
+        action priority
     description : str
         action description
     type : str
-        action type name. read only
+        action type name
 
     Methods
     -------
@@ -50,6 +73,8 @@ class Action:
 
     """
 
+    __slots__ = ('id', 'type', 'definition', 'description')
+
     def __init__(self, id: str,
                  atype: str,
                  definition: Definition,
@@ -64,125 +89,64 @@ class Action:
             description (str): human readable description
         """
 
-        self.__id: str = id
-        self.__type: str = atype
-        self.__definition: Definition = definition
-        self.__description: str = description
-
-    # getter and setters
-    @property
-    def id(self) -> str:
-        """ get the action id
-
-        Returns:
-            str: action id
-        """
-        return self.__id
-
-    @id.setter
-    def id(self, nid: str):
-        """ function to avoid id redefinition
-        """
-        raise ValueError("id redefinition forbidden")
-
-    @property
-    def type(self) -> str:
-        """ get the action type name
-
-        Returns:
-            str :  type name
-        """
-        return self.__type
-
-    @type.setter
-    def type(self, ntype: str):
-        """function to avoid type redefinition
-        """
-        raise ValueError("type redefinition forbidden")
-
-    @property
-    def definition(self) -> Definition:
-        """ get the definition object
-
-        Returns:
-            object: action definition
-        """
-        return self.__definition
-
-    @definition.setter
-    def definition(self, ndef: object):
-        """ function to avoid definition redefinition
-        """
-        raise ValueError("definition redefinition forbidden")
-
-    @property
-    def description(self) -> str:
-        """ get the action description
-
-        Returns:
-            str: action description
-        """
-
-        return self.__description
-
-    @description.setter
-    def description(self, ndesc: str):
-        """ set the action description
-
-        Args:
-            ndesc (str): new action description
-        """
-        self.__description = ndesc
+        self.id: str = id
+        self.type: str = atype
+        self.definition: Definition = definition
+        self.description: str = description
 
     def __repr__(self) -> str:
         """ overload the __repr__ function
         Returns:
             str: human readeable representation of Action
         """
-        return self.__description
+        return self.description
 
     @staticmethod
     def parse(serialize_action: Dict) -> 'Action':
 
-        _type = serialize_action['type']
+        # the type string comes fresh from the DB driver: intern it so
+        # the parser lookup compares by pointer instead of hashing
+        _type = sys.intern(serialize_action['type'])
         id = str(serialize_action['_id'])
 
-        try:
-          definition_object:Definition = ACTION_DEFINITION[_type]
-          definition = definition_object.parse(serialize_action['definition'])
-          
-          description = serialize_action['description']
+        parser = _ACTION_PARSER.get(_type)
+        if parser is None:
+          print(f'Action type {_type} is not a valid action type')
+          return None
 
-          return Action(id, 
-                _type,
-                definition,
-                description)
+        definition = parser(serialize_action['definition'])
+        description = serialize_action['description']
 
-        except KeyError:
-          print(f'Action type {_type} is not a valid action type')
+        return Action(id,
+              _type,
+              definition,
+              description)
 
         
     def to_dict(self, drop_id:bool=False):
-        d_action = {
-            "_id": self.__id,
-            "type": self.__type,
-            "description": self.__description,
-            "definition": self.__definition.to_dict(),
-        }
         if drop_id:
-            d_action.pop('_id')
-        return d_action
+            return dict(zip(_ACTION_KEYS_NO_ID,
+                            (self.type,
+                             self.description,
+                             self.definition.to_dict())))
+
+        return dict(zip(_ACTION_KEYS,
+                        (self.id,
+                         self.type,
+                         self.description,
+                         self.definition.to_dict())))
 
     def get_commands(self):
         # get the command fonction accordig the action type (ex:MOVE.TCP.WORK)
-        # the command register is defined in the register.py file in the mars module
-        cmd_fct = model.COMMAND_REGISTER[self.__type]
-        
-        #apply the fonction with the definition as parameters to get the commands
-        cmd_list = cmd_fct(self.__definition)
-        
-        # return the commands under dict format
-        return [c.to_dict() for c in cmd_list]
+        cmd_fct = _command_fct(self.type)
+
+        # yield the commands under dict format: a generator keeps the
+        # working set bounded when the consumer streams the commands
+        return (c.to_dict() for c in cmd_fct(self.definition))
+
+    def get_commands_list(self):
+        """get the commands as a materialized list"""
+        return list(self.get_commands())
     
     
     @classmethod
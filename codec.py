@@ -0,0 +1,80 @@
+
+"""msgspec-based fast path for trajectory decoding
+
+The hand-written parse methods walk Python dicts produced by a JSON
+loader; when the raw JSON bytes are available, the msgspec C codec
+decodes straight into typed structs and the wrapper objects are built
+from those, skipping the intermediate dict walk entirely. Importing
+this module requires the optional msgspec dependency, which is why the
+entry points on Movement import it lazily.
+"""
+
+from typing import Dict, List, Optional
+
+import msgspec
+import numpy as np
+
+from .movement import (Configuration, Movement, PositionCrt, PositionJoint,
+                       _ARM, _FOREARM, _MTYPE, _WRIST)
+
+
+class _ConfigMsg(msgspec.Struct):
+    wrist: str
+    forearm: str
+    arm: str
+    j4: int
+    j5: int
+    j6: int
+
+
+class _PositionMsg(msgspec.Struct):
+    type: str
+    e1: int
+    # keys depend on the position type, decoded as a plain mapping
+    vector: Dict[str, float]
+    config: Optional[_ConfigMsg] = None
+
+
+class _MovementMsg(msgspec.Struct):
+    cnt: int
+    speed: int
+    type: str
+    position: _PositionMsg
+
+
+# decoders are specialized once at import
+_movement_decoder = msgspec.json.Decoder(_MovementMsg)
+_trajectory_decoder = msgspec.json.Decoder(List[_MovementMsg])
+
+
+def _position_from_msg(msg: _PositionMsg):
+    if msg.type == 'CARTESIAN':
+        config = msg.config
+        vector = np.fromiter(PositionCrt._VECTOR_GETTER(msg.vector),
+                             dtype=np.float32, count=6)
+        return PositionCrt(vector, msg.e1,
+                           Configuration.get(_WRIST[config.wrist],
+                                             _FOREARM[config.forearm],
+                                             _ARM[config.arm],
+                                             config.j4,
+                                             config.j5,
+                                             config.j6))
+
+    vector = np.fromiter(PositionJoint._VECTOR_GETTER(msg.vector),
+                         dtype=np.float32, count=6)
+    return PositionJoint(vector, msg.e1)
+
+
+def _movement_from_msg(msg: _MovementMsg) -> Movement:
+    return Movement(msg.cnt, msg.speed, _MTYPE[msg.type],
+                    _position_from_msg(msg.position))
+
+
+def decode_movement(raw: bytes) -> Movement:
+    """decode one movement from raw JSON bytes"""
+    return _movement_from_msg(_movement_decoder.decode(raw))
+
+
+def decode_trajectory(raw: bytes) -> List[Movement]:
+    """decode a JSON array of movements from raw bytes"""
+    return [_movement_from_msg(m) for m in _trajectory_decoder.decode(raw)]
@@ -1,26 +1,33 @@
 from typing import Dict
 from uuid import uuid4
+
+# static to_dict key tuple, shared by every Command serialization
+_COMMAND_KEYS = ('uid', 'action', 'target', 'description', 'definition')
+
 class Command:
+
+  __slots__ = ('_uid', '_action', '_target', '_description', '_definition')
+
   def __init__(self,
                target:str,
                action:str,
                description:str,
                definition:Dict):
-    self.__uid = str(uuid4())
-    self.__action = action
-    self.__target = target
-    self.__description = description
-    self.__definition = definition
+    # .hex skips the hyphen-formatting pass of str(uuid4())
+    self._uid = uuid4().hex
+    self._action = action
+    self._target = target
+    self._description = description
+    self._definition = definition
   
   @property
   def uid(self):
-    return self.__uid
+    return self._uid
   
   def to_dict(self):
-    return {
-      'uid': self.__uid,
-      'action': self.__action,
-      'target': self.__target,
-      'description' : self.__description,
-      'definition' : self.__definition
-    }
+    return dict(zip(_COMMAND_KEYS,
+                    (self._uid,
+                     self._action,
+                     self._target,
+                     self._description,
+                     self._definition)))
@@ -1,15 +1,70 @@
 
 import abc
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 from typing import Dict, List
 
-import model
-
 from .movement import Movement
 from .equipment import EquipmentI, Operation
 from .reference import ReferenceI
 
-class Definition(object):
-    __metaclass__ = abc.ABCMeta
+
+# EQUIPMENT/REFERENCE sub-registries, bound on first parse once the model
+# package init has replaced its placeholder objects
+_EFFECTORS = None
+_FRAMES = None
+
+
+def _lazy_init():
+    """bind the registry sub-dicts used by the parse hot paths
+
+    the model package is imported here rather than at module top: its
+    init fills the registries after this module is loaded, and keeping
+    the import out of the hot paths leaves only LOAD_FAST work per parse
+    """
+    global _EFFECTORS, _FRAMES
+    import model
+    _EFFECTORS = model.EQUIPMENT['EFFECTOR']
+    _FRAMES = model.REFERENCE['FRAME']
+
+
+@lru_cache(maxsize=None)
+def _equipment_table(eq_type: str) -> Dict:
+    """get the equipment registry sub-dict for an equipment type"""
+    import model
+    return model.EQUIPMENT[eq_type]
+
+
+# itemgetter pulls all keys in one C-level call instead of one
+# BINARY_SUBSCR per field
+_path_fields = itemgetter('ut', 'uf', 'movements')
+_drill_fields = itemgetter('speed', 'feed', 'peak_frequency',
+                           'peak_amplitude', 'clamp_weight',
+                           'drill_thickness')
+_equipment_fields = itemgetter('type', 'reference')
+
+# static to_dict key tuples: dict(zip(...)) reuses the already-hashed
+# key objects instead of rebuilding a dict literal per call
+_PATH_KEYS = ('uf', 'ut', 'movements')
+_DRILL_KEYS = ('speed', 'feed', 'peak_frequency',
+               'peak_amplitude', 'clamp_weight', 'drill_thickness')
+_PROBING_KEYS = ('ut', 'uf', 'movement')
+
+
+def invalidate_caches():
+    """reset the cached registry bindings after a registry reload"""
+    global _EFFECTORS, _FRAMES
+    _EFFECTORS = None
+    _FRAMES = None
+    _equipment_table.cache_clear()
+
+
+class Definition(abc.ABC):
+
+    __slots__ = ()
 
     @abc.abstractmethod
     def parse(serialize_definition: Dict):
@@ -24,6 +79,9 @@ class Path(Definition):
 
     """ Class used to represent a Movement
     """
+
+    __slots__ = ('_uf', '_ut', '_movements')
+
     def __init__(self, uf: ReferenceI, ut: EquipmentI, movements: List[Movement]):
         """Movement object initializer
 
@@ -32,47 +90,45 @@ class Path(Definition):
             ut (int): user tool id
             points (List[Point]): list of points describing the movement
         """
-        self.__uf: ReferenceI = uf
-        self.__ut: EquipmentI = ut
-        self.__movements: List[Movement] = movements
+        self._uf: ReferenceI = uf
+        self._ut: EquipmentI = ut
+        self._movements: List[Movement] = movements
 
     @property
     def user_tool(self) -> EquipmentI:
-        return self.__ut
+        return self._ut
 
     @property
     def user_frame(self) -> ReferenceI:
-        return self.__uf
+        return self._uf
 
     @property
     def movements(self) -> List[Movement]:
-        return self.__movements
+        return self._movements
 
     @staticmethod
     def parse(serialize_movement: Dict) -> 'Path':
-        # get the user tool from dict
-        ut = serialize_movement['ut']
-        # get the corresponding equipment
-        ut = model.EQUIPMENT['EFFECTOR'][ut]
+        if _EFFECTORS is None:
+            _lazy_init()
 
-        # get the user frame from dict
-        uf = serialize_movement['uf']
-        # get the corresponding reference
-        uf = model.REFERENCE['FRAME'][uf]
+        ut, uf, s_movements = _path_fields(serialize_movement)
 
-        movements = []
+        # get the corresponding equipment and reference
+        ut = _EFFECTORS[ut]
+        uf = _FRAMES[uf]
 
-        for sp in serialize_movement['movements']:
-            movements.append(Movement.parse(sp))
+        # parse function bound to a local, comprehension pre-sizes the
+        # result from the source list's length hint
+        _mv_parse = Movement.parse
+        movements = [_mv_parse(sp) for sp in s_movements]
 
         return Path(uf, ut, movements)
 
     def to_dict(self):
-        return { 
-            "uf": self.__uf.name,
-            "ut": self.__ut.name,
-            "movements": [p.to_dict() for p in self.__movements]
-        }
+        return dict(zip(_PATH_KEYS,
+                        (self._uf.name,
+                         self._ut.name,
+                         [p.to_dict() for p in self._movements])))
 
     def to_cmd_data(self) -> Dict:
         """build and return a dictionnary describing the path for commands generation
@@ -80,35 +136,28 @@ class Path(Definition):
         Returns:
             Dict: dictionnary describing the path
         """
-        # init list for setttings
-        m_paras = []
-        # init list for position
-        m_positions = []
-        
-        # extract settings and position from movement list
-        for movement in self.__movements:
-            # get dict describing the movement
-            mvt_cmd_def = movement.to_cmd_data()
-            
-            # insert parameters in m_para and position in m_positions
-            m_paras.extend(mvt_cmd_def['parameters'])
-            m_positions.append(mvt_cmd_def['position'])
+        # extract parameters and position from the movements in one pass,
+        # Movement.to_cmd_data returns a (parameters, position) tuple
+        pairs = [movement.to_cmd_data() for movement in self._movements]
+        m_paras = list(chain.from_iterable(paras for paras, _ in pairs))
+        m_positions = [position for _, position in pairs]
 
         return {
-            "uf": self.__uf.value,
-            "ut": self.__ut.value,
+            "uf": self._uf.value,
+            "ut": self._ut.value,
             "movements": {
                 "parameters": m_paras,
                 "positions": m_positions
             }
         }
 
+@dataclass(frozen=True, slots=True)
 class Drilling(Definition):
-    
+
     # TODO add other parameters in the futur: DrillingCycleLimit, ClampingCycleLimit, TemperatureAlarm, CurrentAlarm
-    # update __init__ parse and to_dict
+    # update parse and to_dict
 
-    """function to init Drilling operation object
+    """Drilling operation definition
     Args:
       speed (int): drill rotation speed in rpm
       feed (int) : drill feed in mm/tr
@@ -117,138 +166,118 @@ class Drilling(Definition):
       clamp_weight (float): clampling weight in kg
       drill_thickness (float) : thickness of the hole in mm
     """
-    def __init__(self,
-                 speed:int,
-                 feed:int,
-                 peak_frequency:float,
-                 peak_amplitude:float,
-                 clamp_weight:float,
-                 drill_thickness:float):
-        self.__speed = speed
-        self.__feed = feed
-        self.__drill_thickness = drill_thickness
-        self.__peak_frequency = peak_frequency
-        self.__peak_amplitude = peak_amplitude
-        self.__clamp_weight = clamp_weight
 
-    @property
-    def speed(self):
-        return self.__speed
-    
-    @property
-    def feed(self):
-        return self.__feed
+    speed: int
+    feed: int
+    peak_frequency: float
+    peak_amplitude: float
+    clamp_weight: float
+    drill_thickness: float
 
-    @property
-    def peak_amplitude(self):
-        return self.__peak_amplitude
-    
-    @property
-    def peak_frequency(self):
-        return self.__peak_frequency
-    
-    @property
-    def drill_thickness(self):
-        return self.__drill_thickness
+    @staticmethod
+    def parse(serialize_definition:Dict):
 
-    @property
-    def clamp_weight(self):
-        return self.__clamp_weight
+        return Drilling(*_drill_fields(serialize_definition))
 
     @staticmethod
-    def parse(serialize_definition:Dict):
-    
-        speed = serialize_definition['speed']
-        feed = serialize_definition['feed']
-        peak_frequency = serialize_definition['peak_frequency']
-        peak_amplitude = serialize_definition['peak_amplitude']
-        clamp_weight = serialize_definition['clamp_weight']
-        drill_thickness = serialize_definition['drill_thickness']
-        
-        return Drilling(speed,
-                        feed,
-                        peak_frequency,
-                        peak_amplitude,
-                        clamp_weight,
-                        drill_thickness)
+    def parse_batch(records) -> List['Drilling']:
+        """parse a batch of drilling parameters in one pass
+
+        Args:
+            records (np.ndarray): structured array with one field per
+                Drilling attribute, in constructor order (speed, feed,
+                peak_frequency, peak_amplitude, clamp_weight,
+                drill_thickness)
+
+        Returns:
+            List[Drilling]: one Drilling per record
+        """
+        # tolist() unpacks the whole buffer into native tuples in C,
+        # so the Python-level work per record is only the construction
+        return [Drilling(*record) for record in records.tolist()]
 
     def to_dict(self):
-        return {
-            'speed' : self.__speed,
-            'feed' : self.__feed,
-            'peak_frequency' : self.__peak_frequency,
-            'peak_amplitude' : self.__peak_amplitude,
-            'clamp_weight' : self.__clamp_weight,
-            'drill_thickness' : self.__drill_thickness
-        }
-        
+        return dict(zip(_DRILL_KEYS,
+                        (self.speed,
+                         self.feed,
+                         self.peak_frequency,
+                         self.peak_amplitude,
+                         self.clamp_weight,
+                         self.drill_thickness)))
+
 
 
 class Probing(Definition):
+
+    __slots__ = ('_uf', '_ut', '_movement')
+
     def __init__(self, ut:EquipmentI, uf:ReferenceI, movement:Movement):
-        self.__uf: ReferenceI = uf
-        self.__ut: EquipmentI = ut
-        self.__movement:Movement = movement
+        self._uf: ReferenceI = uf
+        self._ut: EquipmentI = ut
+        self._movement:Movement = movement
     
     @property
     def user_tool(self):
-        return self.__ut
+        return self._ut
 
     @property
     def user_frame(self):
-        return self.__uf
+        return self._uf
     
     @property
     def movement(self):
-        return self.__movement
+        return self._movement
 
     def parse(serialize_definition: Dict):
-        try:
-            ut = serialize_definition['ut']
-            ut = model.EQUIPMENT['EFFECTOR'][ut]
+        # no try/except around the subscripts: a missing key raises
+        # KeyError by itself, without paying the handler setup per call
+        if _EFFECTORS is None:
+            _lazy_init()
+
+        ut = _EFFECTORS[serialize_definition['ut']]
+        uf = _FRAMES[serialize_definition['uf']]
+
+        movement = Movement.parse(serialize_definition['movement'])
+        return Probing(ut, uf, movement)
 
-            uf = serialize_definition['uf']
-            uf = model.REFERENCE['FRAME'][uf]
 
-            movement = Movement.parse(serialize_definition['movement'])
-            return Probing(ut, uf, movement)
-        except KeyError as error:
-            raise 
-    
     def to_dict(self):
-        return {
-            'ut': self.__ut.name,
-            'uf': self.__uf.name,
-            'movement': self.__movement.to_dict()
-        }
+        return dict(zip(_PROBING_KEYS,
+                        (self._ut.name,
+                         self._uf.name,
+                         self._movement.to_dict())))
 
 
 class Manipulation(Definition):
-    
+
+    __slots__ = ('_operation', '_equipment')
+
     def __init__(self, manipulation_type:Operation, equipment:EquipmentI):
-        self.__operation:Operation = manipulation_type
-        self.__equipment:EquipmentI = equipment
+        self._operation:Operation = manipulation_type
+        self._equipment:EquipmentI = equipment
 
     @property
     def operation(self) -> str:
-        return self.__operation.name
+        return self._operation.name
     
     @property
     def equipment(self) -> EquipmentI:
-        return self.__equipment
+        return self._equipment
 
     @staticmethod
     def parse(manipulation_definition:Dict):
-        eq_type = manipulation_definition['equipment']['type']
-        eq_ref = manipulation_definition['equipment']['reference']
+        eq_type, eq_ref = _equipment_fields(manipulation_definition['equipment'])
+        # interned so the lru_cache lookup in _equipment_table is a
+        # pointer comparison for repeated types
+        eq_type = sys.intern(eq_type)
         operation = manipulation_definition['manipulation']
 
-        equipement = model.EQUIPMENT[eq_type][eq_ref]
+        equipement = _equipment_table(eq_type)[eq_ref]
 
         manip_type = Operation[operation]
 
         return Manipulation(manip_type, equipement)
 
     def to_dict(self):
-        return self.__operation.apply_on(self.__equipment)
+        return self._operation.apply_on(self._equipment)
     
\ No newline at end of file
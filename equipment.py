@@ -1,43 +1,47 @@
 
+import sys
 from enum import Enum
-from functools import partial
 from typing import Dict
-  
+
 class EquipmentI(Enum):
-  pass
+  def __init_subclass__(cls, **kwargs):
+    # the type name is stable per subclass: compute and intern it once
+    # instead of building a fresh upper-cased string on every access
+    super().__init_subclass__(**kwargs)
+    cls._type_cache = sys.intern(cls.__name__.upper())
+
   @property
   def type(self)->str:
-    return self.__class__.__name__.upper()
+    return self._type_cache
   @property
   def reference(self)->str:
     return self.value
 
-def load(equipment:EquipmentI):
-  return {
-    'manipulation': 'LOAD',
-    'equipment': {
-      'type':equipment.type,
-      'reference': equipment.reference
-    }
-  }
-
-def unload(equipment:EquipmentI):
+def _equipment_data(manipulation:str, equipment:EquipmentI) -> Dict:
   return {
-    'manipulation': 'UNLOAD',
+    'manipulation': manipulation,
     'equipment': {
       'type': equipment.type,
       'reference': equipment.reference
     }
   }
 
-class Operation(Enum):
-  LOAD = partial(load)
-  UNLOAD = partial(unload)
+def load(equipment:EquipmentI):
+  return _equipment_data('LOAD', equipment)
 
-  def apply_on(self, equipement:EquipmentI):
-    fct = self.value
-    return fct(equipement)
+def unload(equipment:EquipmentI):
+  return _equipment_data('UNLOAD', equipment)
 
+# direct name -> function dispatch, cheaper than wrapping the functions
+# in partials stored as enum values and unwrapping them on every call
+_OPS = {
+  'LOAD': load,
+  'UNLOAD': unload
+}
 
+class Operation(Enum):
+  LOAD = 'LOAD'
+  UNLOAD = 'UNLOAD'
 
-  
\ No newline at end of file
+  def apply_on(self, equipement:EquipmentI):
+    return _OPS[self.name](equipement)
@@ -1,7 +1,8 @@
 from enum import Enum
+from itertools import chain
+from operator import itemgetter
 from typing import Dict, List, Tuple
 import numpy as np
-import abc
 
 class MovementType(Enum):
     """Path type enumeration
@@ -53,9 +54,26 @@ class ArmConfig(Enum):
     BACKWARD = 'D'
 
 
+# enum member maps bound once at import: a plain mappingproxy lookup
+# replaces EnumMeta.__getitem__ on every parsed waypoint
+_WRIST = WristConfig.__members__
+_FOREARM = ForeArmConfig.__members__
+_ARM = ArmConfig.__members__
+_MTYPE = MovementType.__members__
+
+# interned Configuration flyweights, keyed by the full configuration
+# tuple: a trajectory reuses a handful of arm configurations, so the
+# cache turns N allocations into a few shared instances
+_CONFIG_CACHE = {}
+
+
 class Configuration:
     """Class used to represent the arm configuration
     """
+
+    __slots__ = ('_wrist', '_forearm', '_arm', '_j4', '_j5', '_j6',
+                 '_render_cache')
+
     def __init__(self, wrist: WristConfig,
                  forearm: ForeArmConfig,
                  arm: ArmConfig,
@@ -74,50 +92,114 @@ class Configuration:
             j5 (int, optional) : max rotation code for j5, default 0
             j6 (int, optional) : max rotation code for j6, default 0
         """
-        self.__wrist: WristConfig = wrist
-        self.__forearm: ForeArmConfig = forearm
-        self.__arm: ArmConfig = arm
-        self.__j4: int = 0
-        self.__j5: int = 0
-        self.__j6: int = 0
+        self._wrist: WristConfig = wrist
+        self._forearm: ForeArmConfig = forearm
+        self._arm: ArmConfig = arm
+        self._j4: int = j4
+        self._j5: int = j5
+        self._j6: int = j6
+        self._render_cache = None
+
+    @classmethod
+    def get(cls, wrist: WristConfig,
+            forearm: ForeArmConfig,
+            arm: ArmConfig,
+            j4: int = 0,
+            j5: int = 0,
+            j6: int = 0) -> 'Configuration':
+        """get the shared Configuration instance for the given codes
+
+        configurations are value objects, so equal codes map onto one
+        interned instance
+        """
+        key = (wrist, forearm, arm, j4, j5, j6)
+        config = _CONFIG_CACHE.get(key)
+        if config is None:
+            config = _CONFIG_CACHE[key] = cls(wrist, forearm, arm,
+                                              j4, j5, j6)
+        return config
 
     @staticmethod
     def parse(serialize_config: Dict) -> 'Configuration':
-        wrist = WristConfig[serialize_config['wrist']]
-        forearm = ForeArmConfig[serialize_config['forearm']]
-        arm = ArmConfig[serialize_config['arm']]
+        wrist = _WRIST[serialize_config['wrist']]
+        forearm = _FOREARM[serialize_config['forearm']]
+        arm = _ARM[serialize_config['arm']]
         j4 = serialize_config['j4']
         j5 = serialize_config['j5']
         j6 = serialize_config['j6']
 
-        return Configuration(wrist, forearm, arm, j4, j5, j6)
+        return Configuration.get(wrist, forearm, arm, j4, j5, j6)
+
+    def _render(self):
+        # to_dict and to_cmd_data emit the same shape; the dict is
+        # invariant, so it is built once per flyweight and shared
+        if self._render_cache is None:
+            self._render_cache = {
+                "wrist": self._wrist.name,
+                "forearm": self._forearm.name,
+                "arm": self._arm.name,
+                "j4": self._j4,
+                "j5": self._j5,
+                "j6": self._j6
+            }
+        return self._render_cache
 
     def to_dict(self):
-        return {
-            "wrist": self.__wrist.name,
-            "forearm": self.__forearm.name,
-            "arm": self.__arm.name,
-            "j4": self.__j4,
-            "j5": self.__j5,
-            "j6": self.__j6
-        }
+        return self._render()
 
     def to_cmd_data(self):
-        return {
-            "wrist": self.__wrist.name,
-            "forearm": self.__forearm.name,
-            "arm": self.__arm.name,
-            "j4": self.__j4,
-            "j5": self.__j5,
-            "j6": self.__j6
-        }
+        return self._render()
+
+    def pack(self) -> int:
+        """pack the configuration into a single integer bitfield
+
+        layout: bit 0 wrist, bit 1 forearm, bit 2 arm (member-order
+        codes), then 10 bits each for j4/j5/j6 stored in two's
+        complement — small enough to compare configurations with one
+        integer comparison; max rotation codes outside [-512, 511] do
+        not fit the field and would alias on unpack
+
+        Returns:
+            int: packed configuration code
+        """
+        return (_WRIST_CODE[self._wrist.name]
+                | _FOREARM_CODE[self._forearm.name] << 1
+                | _ARM_CODE[self._arm.name] << 2
+                | (self._j4 & _PACK_J_MASK) << _PACK_J4_SHIFT
+                | (self._j5 & _PACK_J_MASK) << _PACK_J5_SHIFT
+                | (self._j6 & _PACK_J_MASK) << _PACK_J6_SHIFT)
+
+    @classmethod
+    def unpack(cls, code: int) -> 'Configuration':
+        """rebuild the shared Configuration from a packed bitfield
+
+        Args:
+            code (int): code produced by Configuration.pack
+
+        Returns:
+            Configuration: interned instance for the code
+        """
+        # the j fields are two's complement: sign-extend them back so
+        # negative max rotation codes round-trip through pack/unpack
+        j4 = (code >> _PACK_J4_SHIFT) & _PACK_J_MASK
+        j5 = (code >> _PACK_J5_SHIFT) & _PACK_J_MASK
+        j6 = (code >> _PACK_J6_SHIFT) & _PACK_J_MASK
+        return cls.get(_WRIST_MEMBERS[code & 1],
+                       _FOREARM_MEMBERS[(code >> 1) & 1],
+                       _ARM_MEMBERS[(code >> 2) & 1],
+                       j4 - _PACK_J_WRAP if j4 > _PACK_J_MAX else j4,
+                       j5 - _PACK_J_WRAP if j5 > _PACK_J_MAX else j5,
+                       j6 - _PACK_J_WRAP if j6 > _PACK_J_MAX else j6)
 
 class Position:
 
     """Class used to represent a TCP position"""
 
     _VECTOR_KEYS=None
-    __metaclass__ = abc.ABCMeta
+
+    __slots__ = ('_vector', 'type', '_type_value',
+                 '_config', '_e1', '_ut', '_uf',
+                 '_cmd_data_cache', '_owner')
 
     def __init__(self,
                  pvector: np.array,
@@ -139,11 +221,19 @@ class Position:
         """
 
         self._vector: np.array = pvector
-        self.__type: PositionType = ptype
-        self.__config: Configuration = config
-        self.__e1: int = e1
-        self.__ut = ut
-        self.__uf = uf
+        # only the name and value strings of the position type are kept,
+        # enums are immutable so they never go stale; the name is the
+        # public type attribute
+        self.type: str = ptype.name
+        self._type_value: str = ptype.value
+        self._config: Configuration = config
+        self._e1: int = e1
+        self._ut = ut
+        self._uf = uf
+        # memoized to_cmd_data output and backref to the owning
+        # Movement, whose cache embeds the rendered position
+        self._cmd_data_cache = None
+        self._owner = None
 
     @property
     def vector(self):
@@ -152,66 +242,95 @@ class Position:
     @vector.setter
     def vector(self, nvector):
         self._vector = nvector
+        self._invalidate_cmd_data()
 
     @property
     def e1(self):
-        return self.__e1
+        return self._e1
 
     @e1.setter
     def e1(self, ne1):
-        self.__e1 = ne1
+        self._e1 = ne1
+        self._invalidate_cmd_data()
 
-    @property
-    def type(self):
-        return self.__type.name
+    def _invalidate_cmd_data(self):
+        self._cmd_data_cache = None
+        if self._owner is not None:
+            self._owner._cmd_data_cache = None
 
     @staticmethod
     def parse(serialize_position) -> 'Position':
-        type = serialize_position['type']
-        if type == 'CARTESIAN':
-            return PositionCrt.parse(serialize_position)
-        elif type == 'JOINT':
-            return PositionJoint.parse(serialize_position)
-        else:
-            raise Exception('position parsing default')
+        # dispatch through the module-level parser map, an unknown
+        # position type raises KeyError
+        return _PTYPE_PARSERS[serialize_position['type']](serialize_position)
+
+    @classmethod
+    def parse_many(cls, serialize_positions: List[Dict]) -> np.ndarray:
+        """build the vector matrix of a list of serialized positions
+
+        fills one contiguous (N, 6) buffer in a single np.fromiter call
+        instead of allocating one array per position; must be called on
+        the concrete subclass matching the serialized representation
+
+        Args:
+            serialize_positions (List[Dict]): serialized positions
+
+        Returns:
+            np.ndarray: (N, 6) float32 position vectors
+        """
+        getter = cls._VECTOR_GETTER
+        count = 6 * len(serialize_positions)
+        vectors = np.fromiter(
+            chain.from_iterable(getter(sp['vector'])
+                                for sp in serialize_positions),
+            dtype=np.float32, count=count)
+        return vectors.reshape(-1, 6)
 
     def to_dict(self) -> Dict:
-        """ get a dictionnary describing the cartesian position object
+        """ get a dictionnary describing the position object
 
         Returns:
             Dict: dictionnary with Position object informations
         """
-
-        return {
-            "ut": self.__ut,
-            "uf": self.__uf,
-            "type": self.__type.name,
-            "e1": self.__e1,
-            "vector": self.__vector_to_dict(),
-            "config": self.__config.to_dict() if self.__config else None
-        }
+        return self._render('name')
 
     def to_cmd_data(self):
+        # the position is effectively immutable between setter calls,
+        # so the rendered dict is cached until vector/e1 change
+        if self._cmd_data_cache is None:
+            self._cmd_data_cache = self._render('value')
+        return self._cmd_data_cache
+
+    def _render(self, type_field: str) -> Dict:
+        """build the serialized position dict
+
+        to_dict and to_cmd_data only differ by the enum field used for
+        the type entry ('name' or 'value')
+        """
         return {
-            "ut": self.__ut,
-            "uf": self.__uf,
-            "type": self.__type.value,
-            "e1": self.__e1,
-            "vector": self.__vector_to_dict(),
-            "config": self.__config.to_cmd_data() if self.__config else None
+            "ut": self._ut,
+            "uf": self._uf,
+            "type": self.type if type_field == 'name' else self._type_value,
+            "e1": self._e1,
+            "vector": self._vector_to_dict(),
+            "config": self._config._render() if self._config else None
         }
 
-    def __vector_to_dict(self):
-        vector_list = []
-        for index, key in enumerate(self.__class__._VECTOR_KEYS):
-            vector_list.append((key, round(float(self._vector[index]), 3)))
-
-        return dict(vector_list)
+    def _vector_to_dict(self):
+        # np.round + tolist do the rounding and float conversion of the
+        # whole vector in C, zip pairs it with the pre-hashed key tuple;
+        # the float64 upcast keeps the rounded values exact in the output
+        rounded = np.round(self._vector.astype(np.float64), 3).tolist()
+        return dict(zip(self.__class__._VECTOR_KEYS, rounded))
 
 
 class PositionCrt(Position):
 
-    _VECTOR_KEYS = ['x', 'y', 'z', 'w', 'p', 'r']
+    _VECTOR_KEYS = ('x', 'y', 'z', 'w', 'p', 'r')
+    # itemgetter pulls the six components in one C call
+    _VECTOR_GETTER = itemgetter(*_VECTOR_KEYS)
+
+    __slots__ = ()
 
     """ Class used to represent a Position in cartesian representation
     Inherit from Position Class"""
@@ -237,16 +356,19 @@ class PositionCrt(Position):
         e1 = serialize_crtpos['e1']
         config = Configuration.parse(serialize_crtpos['config'])
 
-        svector = serialize_crtpos['vector']
-        vector_array = [svector[key] for key in cls._VECTOR_KEYS]
-        vector = np.array(vector_array)
+        vector = np.fromiter(cls._VECTOR_GETTER(serialize_crtpos['vector']),
+                             dtype=np.float32, count=6)
 
         return cls(vector, e1, config)
 
 
 class PositionJoint(Position):
 
-    _VECTOR_KEYS = ['j1', 'j2', 'j3', 'j4', 'j5', 'j6']
+    _VECTOR_KEYS = ('j1', 'j2', 'j3', 'j4', 'j5', 'j6')
+    # itemgetter pulls the six components in one C call
+    _VECTOR_GETTER = itemgetter(*_VECTOR_KEYS)
+
+    __slots__ = ()
 
     """ Class used to represent a Position in joint representation
     Inherit from Position Class"""
@@ -269,17 +391,27 @@ class PositionJoint(Position):
     def parse(cls, serialize_jntpos: Dict) -> 'PositionJoint':
         e1 = serialize_jntpos['e1']
 
-        svector = serialize_jntpos['vector']
-        vector_array = [svector[key] for key in cls._VECTOR_KEYS]
-        vector = np.array(vector_array)
+        vector = np.fromiter(cls._VECTOR_GETTER(serialize_jntpos['vector']),
+                             dtype=np.float32, count=6)
 
         return cls(vector, e1)
 
 
+# position type -> parser dispatch used by Position.parse
+_PTYPE_PARSERS = {
+    'CARTESIAN': PositionCrt.parse,
+    'JOINT': PositionJoint.parse
+}
+
+
 class Movement:
 
     """ Class used to represent a movement passing point
     """
+
+    __slots__ = ('cnt', 'speed', 'position', 'type', 'type_code',
+                 '_cmd_data_cache')
+
     def __init__(self, cnt: int,
                  speed: int,
                  _type: MovementType,
@@ -292,63 +424,297 @@ class Movement:
             path (Path): trajectory shape
             position (Position): tcp position
         """
-        self.__cnt: int = cnt
-        self.__speed: int = speed
-        self.__position: Position = position
-        self.__type: MovementType = _type
-
-    @property
-    def position(self):
-        return self.__position
+        self.cnt: int = cnt
+        self.speed: int = speed
+        self.position: Position = position
+        # the enum member itself is not kept: the name string covers
+        # serialization and the integer code covers bulk filtering
+        self.type: str = _type.name
+        self.type_code: int = _TYPE_CODE[self.type]
+        # memoized to_cmd_data output, invalidated through the position
+        # backref when vector/e1 are reassigned; a position shared with
+        # a previous movement drops that movement's cache on rebind, so
+        # it cannot keep serving data tied to the stale backref
+        self._cmd_data_cache = None
+        if position._owner is not None:
+            position._owner._cmd_data_cache = None
+        position._owner = self
 
     @property
     def position_type(self):
-        return self.__position.type
-
-    @property
-    def cnt(self)-> int:
-        return self.__cnt
-    
-    @property
-    def speed(self)-> int:
-        return self.__speed
-    
-    @property
-    def type(self)-> int:
-        return self.__type.name
+        return self.position.type
 
     @staticmethod
     def parse(serialize_point: Dict) -> 'Movement':
         cnt = serialize_point['cnt']
-        path = MovementType[serialize_point['type']]
+        path = _MTYPE[serialize_point['type']]
         speed = serialize_point['speed']
         position = Position.parse(serialize_point['position'])
 
         return Movement(cnt, speed, path, position)
 
+    @staticmethod
+    def parse_many(serialize_points: List[Dict]) -> 'MovementBatch':
+        """bulk-parse serialized movements into a columnar batch
+
+        amortizes the dispatch and parsing overhead over the whole list
+        instead of calling Movement.parse per waypoint
+
+        Args:
+            serialize_points (List[Dict]): serialized movements
+
+        Returns:
+            MovementBatch: columnar batch of the movements
+        """
+        return MovementBatch.parse(serialize_points)
+
+    @staticmethod
+    def parse_json(raw: bytes) -> 'Movement':
+        """parse one movement from raw JSON bytes
+
+        goes through the msgspec C codec (optional dependency), which
+        decodes the bytes without building an intermediate dict
+
+        Args:
+            raw (bytes): JSON document describing the movement
+
+        Returns:
+            Movement: parsed movement
+        """
+        from .codec import decode_movement
+        return decode_movement(raw)
+
+    @staticmethod
+    def parse_json_trajectory(raw: bytes) -> List['Movement']:
+        """parse a JSON array of movements from raw bytes
+
+        see parse_json; the decoder is specialized for the whole array,
+        so the per-movement decode cost stays in C
+
+        Args:
+            raw (bytes): JSON array of serialized movements
+
+        Returns:
+            List[Movement]: parsed movements
+        """
+        from .codec import decode_trajectory
+        return decode_trajectory(raw)
+
     def to_dict(self):
         return {
-            "cnt": self.__cnt,
-            "speed": self.__speed,
-            "position": self.__position.to_dict(),
-            "type": self.__type.name
+            "cnt": self.cnt,
+            "speed": self.speed,
+            "position": self.position.to_dict(),
+            "type": self.type
         }
 
-    def to_cmd_data(self) -> Dict:
-        return {
-            "parameters": {
-                    "cnt": self.__cnt,
-                    "speed": self.__speed,
-                    "type": self.__type
-                },
-            "position": self.__position.to_cmd_data()
-            }
+    def to_cmd_data(self) -> Tuple[Dict, Dict]:
+        """build the data describing the movement for commands generation
+
+        Returns:
+            Tuple[Dict, Dict]: movement parameters and position
+        """
+        if self._cmd_data_cache is not None:
+            return self._cmd_data_cache
+        parameters = {
+            "cnt": self.cnt,
+            "speed": self.speed,
+            "type": self.type
+        }
+        cmd_data = (parameters, self.position.to_cmd_data())
+        # only the position's current owner receives invalidations, so
+        # a movement that lost the backref renders fresh every call
+        # instead of memoizing data it could never drop
+        if self.position._owner is self:
+            self._cmd_data_cache = cmd_data
+        return cmd_data
     '''
     def get_sequence(self) -> Dict:
 
-        path = proxyapi.PathCode[self.__path.name].value
+        path = proxyapi.PathCode[self._path.name].value
 
         return {
-            "settings": [path, self.__speed, self.__cnt],
-            "position": self.__position.get_sequence()
-        }'''
\ No newline at end of file
+            "settings": [path, self._speed, self._cnt],
+            "position": self._position.get_sequence()
+        }'''
+
+
+# integer codes for the columnar batch representation, index order
+# follows the enum member order
+_TYPE_CODE = {name: code for code, name in enumerate(MovementType.__members__)}
+_PTYPE_CODE = {name: code for code, name in enumerate(PositionType.__members__)}
+_WRIST_CODE = {name: code for code, name in enumerate(WristConfig.__members__)}
+_FOREARM_CODE = {name: code for code, name in enumerate(ForeArmConfig.__members__)}
+_ARM_CODE = {name: code for code, name in enumerate(ArmConfig.__members__)}
+
+# code used in the config columns for rows without arm configuration
+# (joint positions)
+_NO_CONFIG = -1
+
+# movement fields pulled together for the bulk parse path
+_MOVEMENT_FIELDS = itemgetter('cnt', 'speed', 'type', 'position')
+
+# enum members indexed by their batch code, inverse of the maps above
+_WRIST_MEMBERS = tuple(WristConfig)
+_FOREARM_MEMBERS = tuple(ForeArmConfig)
+_ARM_MEMBERS = tuple(ArmConfig)
+
+# packed configuration bitfield layout: 1 bit per flag (member-order
+# code), 10 bits per max rotation code in two's complement
+_PACK_J4_SHIFT = 3
+_PACK_J5_SHIFT = 13
+_PACK_J6_SHIFT = 23
+_PACK_J_MASK = 0x3FF
+_PACK_J_MAX = 511
+_PACK_J_WRAP = 1024
+
+
+class MovementBatch:
+
+    """Structure-of-arrays container for a batch of movements
+
+    One column per movement/position field, so bulk kinematics and
+    serialization run as whole-column numpy operations instead of
+    per-object attribute access over a list of Movement instances.
+
+    Attributes
+    ----------
+    vectors : np.ndarray
+        (N, 6) position vectors, one row per movement
+    e1 : np.ndarray
+        (N,) 7 axis positions
+    cnt : np.ndarray
+        (N,) passing accuracies
+    speed : np.ndarray
+        (N,) movement speeds
+    type_code : np.ndarray
+        (N,) movement type codes (index in MovementType member order)
+    ptype_code : np.ndarray
+        (N,) position type codes (index in PositionType member order)
+    wrist, forearm, arm : np.ndarray
+        (N,) arm configuration codes, -1 for rows without configuration
+    j4, j5, j6 : np.ndarray
+        (N,) max rotation codes, 0 for rows without configuration
+    """
+
+    __slots__ = ('vectors', 'e1', 'cnt', 'speed', 'type_code',
+                 'ptype_code', 'wrist', 'forearm', 'arm',
+                 'j4', 'j5', 'j6')
+
+    def __init__(self, size: int):
+        """allocate the columns for a batch of movements
+
+        Args:
+            size (int): number of movements in the batch
+        """
+        self.vectors = np.empty((size, 6), dtype=np.float32)
+        self.e1 = np.empty(size, dtype=np.int32)
+        self.cnt = np.empty(size, dtype=np.int32)
+        self.speed = np.empty(size, dtype=np.int32)
+        self.type_code = np.empty(size, dtype=np.int8)
+        self.ptype_code = np.empty(size, dtype=np.int8)
+        self.wrist = np.empty(size, dtype=np.int8)
+        self.forearm = np.empty(size, dtype=np.int8)
+        self.arm = np.empty(size, dtype=np.int8)
+        # int16: the max rotation codes span the packed field's
+        # [-512, 511] range, which overflows int8
+        self.j4 = np.empty(size, dtype=np.int16)
+        self.j5 = np.empty(size, dtype=np.int16)
+        self.j6 = np.empty(size, dtype=np.int16)
+
+    def __len__(self):
+        return self.vectors.shape[0]
+
+    @classmethod
+    def parse(cls, serialize_movements: List[Dict]) -> 'MovementBatch':
+        """fill a batch from a list of serialized movements
+
+        Args:
+            serialize_movements (List[Dict]): serialized movements, as
+                accepted by Movement.parse
+
+        Returns:
+            MovementBatch: columnar batch of the movements
+        """
+        n = len(serialize_movements)
+        batch = cls(n)
+
+        # movement fields pulled in one itemgetter call per movement and
+        # assigned column-wise
+        cnt, speed, mtype, positions = zip(
+            *(_MOVEMENT_FIELDS(sm) for sm in serialize_movements)
+        ) if n else ((), (), (), ())
+
+        batch.cnt[:] = cnt
+        batch.speed[:] = speed
+        batch.type_code[:] = [_TYPE_CODE[t] for t in mtype]
+        batch.ptype_code[:] = [_PTYPE_CODE[sp['type']] for sp in positions]
+        batch.e1[:] = [sp['e1'] for sp in positions]
+
+        # the whole vector matrix is streamed into one contiguous buffer
+        crt_getter = PositionCrt._VECTOR_GETTER
+        jnt_getter = PositionJoint._VECTOR_GETTER
+        batch.vectors[:] = np.fromiter(
+            chain.from_iterable(
+                (crt_getter if sp['type'] == 'CARTESIAN' else jnt_getter)(sp['vector'])
+                for sp in positions),
+            dtype=np.float32, count=6 * n).reshape(n, 6)
+
+        for row, sp in enumerate(positions):
+            if sp['type'] == 'CARTESIAN':
+                config = sp['config']
+                batch.wrist[row] = _WRIST_CODE[config['wrist']]
+                batch.forearm[row] = _FOREARM_CODE[config['forearm']]
+                batch.arm[row] = _ARM_CODE[config['arm']]
+                batch.j4[row] = config['j4']
+                batch.j5[row] = config['j5']
+                batch.j6[row] = config['j6']
+            else:
+                batch.wrist[row] = _NO_CONFIG
+                batch.forearm[row] = _NO_CONFIG
+                batch.arm[row] = _NO_CONFIG
+                batch.j4[row] = 0
+                batch.j5[row] = 0
+                batch.j6[row] = 0
+
+        return batch
+
+    def config_packed(self) -> np.ndarray:
+        """pack the configuration columns into one uint64 code per row
+
+        same bit layout as Configuration.pack, computed on the whole
+        batch in vectorized numpy; rows without configuration get all
+        bits set, so two trajectories' configurations compare with a
+        single np.array_equal on the packed columns
+
+        Returns:
+            np.ndarray: (N,) uint64 packed configuration codes
+        """
+        packed = ((self.wrist.astype(np.int64) & 1)
+                  | (self.forearm.astype(np.int64) & 1) << 1
+                  | (self.arm.astype(np.int64) & 1) << 2
+                  | (self.j4.astype(np.int64) & _PACK_J_MASK) << _PACK_J4_SHIFT
+                  | (self.j5.astype(np.int64) & _PACK_J_MASK) << _PACK_J5_SHIFT
+                  | (self.j6.astype(np.int64) & _PACK_J_MASK) << _PACK_J6_SHIFT
+                  ).astype(np.uint64)
+        packed[self.wrist == _NO_CONFIG] = np.iinfo(np.uint64).max
+        return packed
+
+    def vectors_to_dicts(self) -> List[Dict]:
+        """serialize every position vector of the batch
+
+        the rounding and float conversion of the whole matrix run in one
+        numpy pass instead of once per position
+
+        Returns:
+            List[Dict]: one vector dict per movement, keyed according to
+                the position type of the row
+        """
+        rounded = np.round(self.vectors.astype(np.float64), 3).tolist()
+
+        crt_keys = PositionCrt._VECTOR_KEYS
+        jnt_keys = PositionJoint._VECTOR_KEYS
+        crt_code = _PTYPE_CODE['CARTESIAN']
+
+        return [dict(zip(crt_keys if code == crt_code else jnt_keys, row))
+                for code, row in zip(self.ptype_code.tolist(), rounded)]
\ No newline at end of file
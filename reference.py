@@ -1,9 +1,16 @@
+import sys
 from enum import Enum
 
 class ReferenceI(Enum):
+  def __init_subclass__(cls, **kwargs):
+    # the type name is stable per subclass: compute and intern it once
+    # instead of building a fresh upper-cased string on every access
+    super().__init_subclass__(**kwargs)
+    cls._type_cache = sys.intern(cls.__name__.upper())
+
   @property
   def type(self)->str:
-    return self.__class__.__name__.upper()
+    return self._type_cache
   @property
   def reference(self)->str:
     return self.value